@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+import json
 import os
-from pprint import pprint
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
 from resources.user_profile_store import get_user_profile
 from tools.compiler import compile_digest
@@ -9,7 +18,7 @@ from tools.deliverer import deliver_digest
 from tools.disambiguator import disambiguate_entities
 from tools.entity_extractor import extract_entities
 from tools.fact_checker import fact_check
-from tools.fetcher import fetch_articles
+from tools.fetcher import fetch_articles, fetch_articles_within
 from tools.passage_extractor import extract_passages
 from tools.ranker import rank_stories
 from tools.sentiment_analyzer import analyze_sentiment
@@ -17,6 +26,32 @@ from tools.tag_summarizer import summarize_tags
 from tools.tagger import tag_entities
 from tools.topic_classifier import classify_topic
 
+_LIVE_FEED = "http://rss.cnn.com/rss/cnn_topstories.rss"
+
+
+def _run_stages(stages: Dict[str, Callable[[], Any]], parallel: bool) -> Dict[str, Any]:
+    """Run independent pipeline stages, concurrently when they block on the network."""
+
+    if not parallel:
+        return {name: stage() for name, stage in stages.items()}
+
+    with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+        futures = {name: executor.submit(stage) for name, stage in stages.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _dump_state(state: Dict[str, Any]) -> None:
+    """Write the pipeline state to stdout as indented JSON."""
+
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches the stdlib fallback, which stringifies non-str keys.
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        payload = orjson.dumps(state, option=options)
+    else:
+        payload = json.dumps(state, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    sys.stdout.buffer.write(payload + b"\n")
+    sys.stdout.buffer.flush()
+
 
 def run_demo() -> None:
     """Run the newsroom pipeline locally so it is easy to validate."""
@@ -24,9 +59,15 @@ def run_demo() -> None:
     llm_enabled = os.getenv("NEWSROOM_USE_LLM", "false").lower() in {"1", "true", "yes"}
     profile = get_user_profile("demo-user")
 
-    try:
-        fetched = fetch_articles(source="http://rss.cnn.com/rss/cnn_topstories.rss", limit=3)
-    except Exception:
+    offline = os.getenv("NEWSROOM_OFFLINE", "false").lower() in {"1", "true", "yes"}
+
+    fetched = None
+    if not offline:
+        try:
+            fetched = fetch_articles_within(_LIVE_FEED, 2.0, limit=3)
+        except Exception:
+            fetched = None
+    if fetched is None:
         fetched = fetch_articles(source="sample", limit=2)
     articles = fetched["articles"]
 
@@ -35,7 +76,24 @@ def run_demo() -> None:
         passages = extract_passages(article_id=article["id"], content=article["content"])
         all_passages.extend(passages["passages"])
 
-    entities = extract_entities(all_passages, llm_mode=llm_enabled)
+    claims = [f"{article['title']} was announced" for article in articles]
+
+    # These stages only depend on the passages/articles, so with LLM calls enabled they
+    # are overlapped instead of paying each network round trip in turn.
+    stage_results = _run_stages(
+        {
+            "entities": partial(extract_entities, all_passages, llm_mode=llm_enabled),
+            "topics": partial(classify_topic, all_passages, llm_mode=llm_enabled),
+            "sentiments": partial(analyze_sentiment, all_passages),
+            "fact_checks": partial(fact_check, claims, llm_mode=llm_enabled),
+        },
+        parallel=llm_enabled,
+    )
+    entities = stage_results["entities"]
+    topics = stage_results["topics"]
+    sentiments = stage_results["sentiments"]
+    fact_checks = stage_results["fact_checks"]
+
     resolved = disambiguate_entities(
         entities["entities"],
         context="newsroom demo",
@@ -43,23 +101,17 @@ def run_demo() -> None:
     )
     tagged = tag_entities(resolved["resolved_entities"])
 
-    topics = classify_topic(all_passages, llm_mode=llm_enabled)
-    sentiments = analyze_sentiment(all_passages)
-
     summaries = summarize_tags(
         tagged["tagged_entities"],
         all_passages,
         llm_mode=llm_enabled,
     )
 
-    claims = [f"{article['title']} was announced" for article in articles]
-    fact_checks = fact_check(claims, llm_mode=llm_enabled)
-
     ranked = rank_stories(profile, summaries["tag_summaries"], articles)
     digest = compile_digest(ranked["ranked_summaries"])
     delivery = deliver_digest(digest["digest"], delivery_channel="email", user_id=profile["user_id"])
 
-    pprint(
+    _dump_state(
         {
             "articles": articles,
             "passages": all_passages,
@@ -0,0 +1,92 @@
+"""Keyword lexicons shared by the rule-based sentiment and topic tools."""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None  # type: ignore[assignment]
+
+# Immutable because the scanners below are compiled from these tables at import time.
+POSITIVE_CUES: FrozenSet[str] = frozenset(
+    {"improved", "expanding", "better", "engaged", "helps", "support"}
+)
+NEGATIVE_CUES: FrozenSet[str] = frozenset({"concern", "risk", "problem", "delay"})
+
+TOPIC_KEYWORDS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "Technology": ("ai", "automation", "toolkit", "openai"),
+        "Climate": ("climate", "air quality", "sensors"),
+        "Civic": ("community", "policymakers", "residents"),
+    }
+)
+
+_POSITIVE = -2
+_NEGATIVE = -1
+
+# Topics in priority order; non-negative buckets index into this table.
+_TOPIC_TABLE: Tuple[str, ...] = tuple(TOPIC_KEYWORDS)
+
+# Every cue with its bucket, sentiment first and then topics in priority order.
+_CUE_BUCKETS: Dict[str, int] = {}
+for _cue in sorted(POSITIVE_CUES):
+    _CUE_BUCKETS[_cue] = _POSITIVE
+for _cue in sorted(NEGATIVE_CUES):
+    _CUE_BUCKETS[_cue] = _NEGATIVE
+for _rank, _keywords in enumerate(TOPIC_KEYWORDS.values()):
+    for _cue in _keywords:
+        _CUE_BUCKETS.setdefault(_cue, _rank)
+
+# The lookahead reports one cue per position, so overlapping cues ("openai" and "ai") are
+# all seen. Alternatives keep bucket order, so where two cues start at the same position
+# (such as "ai" and "air quality") the higher-priority one is reported.
+_CUE_RE = re.compile("(?=(" + "|".join(map(re.escape, _CUE_BUCKETS)) + "))")
+
+
+def _build_automaton() -> Optional["ahocorasick.Automaton"]:
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for cue in _CUE_BUCKETS:
+        automaton.add_word(cue, cue)
+    automaton.make_automaton()
+    return automaton
+
+
+_AUTOMATON = _build_automaton()
+
+
+@lru_cache(maxsize=1024)
+def scan_cues(text: str) -> Tuple[int, int, Optional[str]]:
+    """Scan ``text`` once, case-insensitively, for every cue.
+
+    Returns the number of distinct positive and negative cues present and the
+    highest-priority topic with a keyword in the text (``None`` when no topic matched).
+    Results are cached on the raw text because the sentiment and topic tools scan the
+    same passages, so the second tool skips both the lowercasing and the scan.
+    """
+
+    text_lower = text.lower()
+
+    if _AUTOMATON is not None:
+        found = {cue for _, cue in _AUTOMATON.iter(text_lower)}
+    else:
+        found = {match.group(1) for match in _CUE_RE.finditer(text_lower)}
+
+    positive = negative = 0
+    topic_rank: Optional[int] = None
+    for cue in found:
+        bucket = _CUE_BUCKETS[cue]
+        if bucket == _POSITIVE:
+            positive += 1
+        elif bucket == _NEGATIVE:
+            negative += 1
+        elif topic_rank is None or bucket < topic_rank:
+            topic_rank = bucket
+    topic = None if topic_rank is None else _TOPIC_TABLE[topic_rank]
+    return positive, negative, topic
@@ -1,26 +1,107 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import hashlib
+import io
 import json
 import os
-from typing import Any, Dict, List, Optional, Sequence
+import re
+import threading
+import weakref
+from collections import OrderedDict, defaultdict
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
 except ImportError:  # pragma: no cover - optional dependency
+    AsyncOpenAI = None  # type: ignore[assignment]
     OpenAI = None  # type: ignore[assignment]
 
-PromptMessage = Dict[str, Any]
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import diskcache
+except ImportError:  # pragma: no cover - optional dependency
+    diskcache = None  # type: ignore[assignment]
+
+PromptMessage = Dict[str, str]
+T = TypeVar("T")
+SpanRecord = TypeVar("SpanRecord", bound=Mapping[str, object])
 
 
 _DEFAULT_MODEL = os.getenv("NEWSROOM_OPENAI_MODEL", "gpt-4o-mini")
 _LLM_UNAVAILABLE_ERR = "OpenAI client unavailable; set OPENAI_API_KEY to enable llm_mode"
+_CACHE_DIR = Path(os.getenv("NEWSROOM_LLM_CACHE_DIR", "~/.cache/newsroom-llm")).expanduser()
+_CACHE_MAXSIZE = 512
+_WINDOW_TOKEN_BUDGET = 6000
+_WORD_RE = re.compile(r"\S+")
+
+# Raw JSON completions keyed by request digest; parsed afresh on every hit so callers
+# can freely mutate the returned payloads.
+_RESPONSE_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Long-lived loop that the synchronous wrappers run their coroutines on, so its
+# AsyncOpenAI client (and connection pool) survives from one call to the next.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _dumps(obj: Any, *, sort_keys: bool = False) -> str:
+    # The stdlib fallback mirrors orjson's compact, non-ASCII-escaping output so prompts
+    # (and therefore cache keys) are identical with or without orjson installed.
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0).decode("utf-8")
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False)
+
+
+def _loads(content: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
 
 
 def _message(role: str, text: str) -> PromptMessage:
-    return {"role": role, "content": [{"type": "text", "text": text}]}
+    return {"role": role, "content": text}
+
+
+def _new_messages(system_prompt: Sequence[PromptMessage], *payloads: Any) -> List[PromptMessage]:
+    """Return a fresh message list: the shared system prompt followed by JSON user payloads."""
 
+    return [*system_prompt, *(_message("user", _dumps(payload)) for payload in payloads)]
 
-_PASSAGE_SYSTEM_PROMPT: List[PromptMessage] = [
+
+_PASSAGE_PROMPT_ID = "newsroom.passages.v1"
+_PASSAGE_SYSTEM_PROMPT: Tuple[PromptMessage, ...] = (
     _message(
         "system",
         (
@@ -29,34 +110,39 @@ _PASSAGE_SYSTEM_PROMPT: List[PromptMessage] = [
             "contains a 'text' field. Keep each passage focused and under the provided "
             "max_length in characters. Avoid overlapping content."
         ),
-    )
-]
+    ),
+)
 
-_ENTITY_SYSTEM_PROMPT: List[PromptMessage] = [
+_ENTITY_PROMPT_ID = "newsroom.entities.v1"
+_ENTITY_SYSTEM_PROMPT: Tuple[PromptMessage, ...] = (
     _message(
         "system",
         (
-            "You are an information extraction assistant for a newsroom. Return JSON with "
-            "a single key 'entities' whose value is a list. Each list item must be an object "
-            "containing span, type (PERSON/ORG/LOCATION/OTHER), passage_id, article_id, and "
-            "context (a short excerpt)."
+            "You are an information extraction assistant for a newsroom. The user message "
+            "contains a list under key 'passages'; each item has passage_id, article_id, and "
+            "text. Return JSON with a single key 'entities' whose value is a list. Each list "
+            "item must be an object containing span, type (PERSON/ORG/LOCATION/OTHER), "
+            "passage_id, article_id, and context (a short excerpt)."
         ),
-    )
-]
+    ),
+)
 
-_TOPIC_SYSTEM_PROMPT: List[PromptMessage] = [
+_TOPIC_PROMPT_ID = "newsroom.topics.v1"
+_TOPIC_SYSTEM_PROMPT: Tuple[PromptMessage, ...] = (
     _message(
         "system",
         (
-            "You are a newsroom beat classifier. Categorise each news passage into one of the "
-            "beats: Technology, Climate, Civic, or General (use General when unsure). Return "
-            "JSON with key 'topics' whose value is a list of objects containing passage_id, "
-            "topic, and confidence (0-1)."
+            "You are a newsroom beat classifier. The user message contains a list under key "
+            "'passages'; each item has passage_id, article_id, and text. Categorise each "
+            "passage into one of the beats: Technology, Climate, Civic, or General (use General "
+            "when unsure). Return JSON with key 'topics' whose value is a list of objects "
+            "containing passage_id, topic, and confidence (0-1)."
         ),
-    )
-]
+    ),
+)
 
-_DISAMBIGUATION_SYSTEM_PROMPT: List[PromptMessage] = [
+_DISAMBIGUATION_PROMPT_ID = "newsroom.disambiguation.v1"
+_DISAMBIGUATION_SYSTEM_PROMPT: Tuple[PromptMessage, ...] = (
     _message(
         "system",
         (
@@ -64,10 +150,11 @@ _DISAMBIGUATION_SYSTEM_PROMPT: List[PromptMessage] = [
             "JSON with key 'resolved_entities' whose value is a list of objects. Each object must "
             "provide span, canonical_id, confidence (0-1), type, passage_id, and article_id."
         ),
-    )
-]
+    ),
+)
 
-_TAG_SUMMARY_SYSTEM_PROMPT: List[PromptMessage] = [
+_TAG_SUMMARY_PROMPT_ID = "newsroom.tag_summaries.v1"
+_TAG_SUMMARY_SYSTEM_PROMPT: Tuple[PromptMessage, ...] = (
     _message(
         "system",
         (
@@ -75,10 +162,11 @@ _TAG_SUMMARY_SYSTEM_PROMPT: List[PromptMessage] = [
             "highlights. Return JSON with key 'tag_summaries', a list where each item has tag, "
             "canonical_id, category, highlights (list of strings), and article_ids (list of strings)."
         ),
-    )
-]
+    ),
+)
 
-_TAGGING_SYSTEM_PROMPT: List[PromptMessage] = [
+_TAGGING_PROMPT_ID = "newsroom.tagging.v1"
+_TAGGING_SYSTEM_PROMPT: Tuple[PromptMessage, ...] = (
     _message(
         "system",
         (
@@ -86,10 +174,11 @@ _TAGGING_SYSTEM_PROMPT: List[PromptMessage] = [
             "'tagged_entities'. Each item must include entity (original span), canonical_id, "
             "category, passage_id, and article_id. Use concise, consistent category labels."
         ),
-    )
-]
+    ),
+)
 
-_FACT_CHECK_SYSTEM_PROMPT: List[PromptMessage] = [
+_FACT_CHECK_PROMPT_ID = "newsroom.fact_check.v1"
+_FACT_CHECK_SYSTEM_PROMPT: Tuple[PromptMessage, ...] = (
     _message(
         "system",
         (
@@ -97,10 +186,11 @@ _FACT_CHECK_SYSTEM_PROMPT: List[PromptMessage] = [
             "'checked_claims'. The list entries must contain claim, status (supported/contradicted/"
             "unverified), and references (list of {source,url})."
         ),
-    )
-]
+    ),
+)
 
 
+@lru_cache(maxsize=1)
 def _client() -> Optional["OpenAI"]:
     if OpenAI is None:
         return None
@@ -109,59 +199,447 @@ def _client() -> Optional["OpenAI"]:
     return OpenAI()
 
 
+def _async_client() -> Optional["AsyncOpenAI"]:
+    if AsyncOpenAI is None:
+        return None
+    if not os.getenv("OPENAI_API_KEY"):
+        return None
+
+    # httpx async connection pools are bound to the loop that opened them, so the
+    # client is shared per event loop rather than per process.
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        client = _ASYNC_CLIENTS[loop] = AsyncOpenAI()
+    return client
+
+
+def clear_client_cache() -> None:
+    """Forget the shared OpenAI clients so the next call re-reads the environment."""
+
+    _client.cache_clear()
+    if _LOOP is not None:
+        client = _ASYNC_CLIENTS.pop(_LOOP, None)
+        if client is not None:
+            asyncio.run_coroutine_threadsafe(client.close(), _LOOP)
+    _ASYNC_CLIENTS.clear()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared LLM event loop, starting its thread on first use."""
+
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="newsroom-llm", daemon=True)
+            thread.start()
+            atexit.register(_shutdown_background_loop, loop)
+            _LOOP = loop
+        return _LOOP
+
+
+def _shutdown_background_loop(loop: asyncio.AbstractEventLoop) -> None:
+    client = _ASYNC_CLIENTS.pop(loop, None)
+    if client is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(client.close(), loop).result(timeout=5)
+        except Exception:  # pragma: no cover - best effort during interpreter exit
+            pass
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def _cache_enabled() -> bool:
+    return os.getenv("NEWSROOM_LLM_CACHE", "1").lower() not in {"0", "false", "no"}
+
+
+@lru_cache(maxsize=1)
+def _disk_cache() -> Optional["diskcache.Cache"]:
+    if diskcache is None:
+        return None
+    try:
+        return diskcache.Cache(str(_CACHE_DIR))
+    except OSError:  # pragma: no cover - unwritable cache directory
+        return None
+
+
+def _cache_key(messages: Sequence[PromptMessage], model: str, temperature: float) -> str:
+    payload = _dumps(
+        {"model": model, "temperature": temperature, "messages": messages},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[str]:
+    with _RESPONSE_CACHE_LOCK:
+        content = _RESPONSE_CACHE.get(key)
+        if content is not None:
+            _RESPONSE_CACHE.move_to_end(key)
+            return content
+
+    disk = _disk_cache()
+    if disk is None:
+        return None
+    content = disk.get(key)
+    if isinstance(content, str):
+        _cache_put(key, content, persist=False)
+        return content
+    return None
+
+
+def _cache_put(key: str, content: str, *, persist: bool = True) -> None:
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[key] = content
+        _RESPONSE_CACHE.move_to_end(key)
+        while len(_RESPONSE_CACHE) > _CACHE_MAXSIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+
+    disk = _disk_cache() if persist else None
+    if disk is not None:
+        disk.set(key, content)
+
+
+def clear_response_cache() -> None:
+    """Drop cached LLM responses from memory and, when configured, from disk."""
+
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
+    disk = _disk_cache()
+    if disk is not None:
+        disk.clear()
+
+
+def _completion_kwargs(
+    messages: Sequence[PromptMessage],
+    model: str,
+    temperature: float,
+    cache_key: Optional[str],
+    stream: bool = False,
+) -> Dict[str, Any]:
+    # ``prompt_cache_key`` steers requests sharing a static system prefix to the same
+    # OpenAI prompt cache; it is sent via ``extra_body`` so older SDKs still accept it.
+    return {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "response_format": {"type": "json_object"},
+        "extra_body": {"prompt_cache_key": cache_key} if cache_key else None,
+        "stream": stream,
+    }
+
+
+def _completion_content(completion: Any) -> str:
+    try:
+        return completion.choices[0].message.content or ""
+    except (AttributeError, IndexError) as exc:  # pragma: no cover - defensive
+        raise RuntimeError("Unexpected response format from OpenAI") from exc
+
+
+def _stream_content(chunks: Iterable[Any]) -> str:
+    """Accumulate streamed completion deltas into the final message content."""
+
+    buffer = io.StringIO()
+    for chunk in chunks:
+        try:
+            delta = chunk.choices[0].delta.content
+        except (AttributeError, IndexError):  # pragma: no cover - e.g. trailing usage chunk
+            continue
+        if delta:
+            buffer.write(delta)
+    return buffer.getvalue()
+
+
+async def _astream_content(chunks: AsyncIterable[Any]) -> str:
+    buffer = io.StringIO()
+    async for chunk in chunks:
+        try:
+            delta = chunk.choices[0].delta.content
+        except (AttributeError, IndexError):  # pragma: no cover - e.g. trailing usage chunk
+            continue
+        if delta:
+            buffer.write(delta)
+    return buffer.getvalue()
+
+
+def _parse_json(content: str) -> Dict[str, Any]:
+    try:
+        return _loads(content)
+    except json.JSONDecodeError as exc:  # pragma: no cover - defensive
+        raise RuntimeError("OpenAI response was not valid JSON") from exc
+
+
 def _call_json_response(
     messages: Sequence[PromptMessage],
     *,
     model: Optional[str] = None,
     temperature: float = 0.0,
+    cache_key: Optional[str] = None,
+    stream: bool = False,
 ) -> Dict[str, Any]:
+    model = model or _DEFAULT_MODEL
+    use_cache = _cache_enabled()
+    key = _cache_key(messages, model, temperature) if use_cache else ""
+
+    if use_cache:
+        cached = _cache_get(key)
+        if cached is not None:
+            return _loads(cached)
+
     client = _client()
     if client is None:
         raise RuntimeError(_LLM_UNAVAILABLE_ERR)
 
+    # Long JSON outputs are streamed so the body is assembled while it is generated.
     completion = client.chat.completions.create(
-        model=model or _DEFAULT_MODEL,
-        messages=list(messages),
-        temperature=temperature,
-        response_format={"type": "json_object"},
+        **_completion_kwargs(messages, model, temperature, cache_key, stream=stream)
     )
+    content = _stream_content(completion) if stream else _completion_content(completion)
+    parsed = _parse_json(content)
 
-    try:
-        content = completion.choices[0].message.content or ""
-    except (AttributeError, IndexError) as exc:  # pragma: no cover - defensive
-        raise RuntimeError("Unexpected response format from OpenAI") from exc
+    if use_cache:
+        _cache_put(key, content)
+    return parsed
+
+
+async def _acall_json_response(
+    messages: Sequence[PromptMessage],
+    *,
+    model: Optional[str] = None,
+    temperature: float = 0.0,
+    cache_key: Optional[str] = None,
+    stream: bool = False,
+) -> Dict[str, Any]:
+    model = model or _DEFAULT_MODEL
+    use_cache = _cache_enabled()
+    key = _cache_key(messages, model, temperature) if use_cache else ""
 
+    if use_cache:
+        cached = _cache_get(key)
+        if cached is not None:
+            return _loads(cached)
+
+    client = _async_client()
+    if client is None:
+        raise RuntimeError(_LLM_UNAVAILABLE_ERR)
+
+    completion = await client.chat.completions.create(
+        **_completion_kwargs(messages, model, temperature, cache_key, stream=stream)
+    )
+    if stream:
+        content = await _astream_content(completion)
+    else:
+        content = _completion_content(completion)
+    parsed = _parse_json(content)
+
+    if use_cache:
+        _cache_put(key, content)
+    return parsed
+
+
+async def _gather_records(
+    windows: Sequence[T],
+    build_messages: Callable[[T], List[PromptMessage]],
+    result_key: str,
+    *,
+    model: Optional[str],
+    cache_key: str,
+    temperature: float = 0.0,
+    stream: bool = False,
+) -> List[Dict[str, Any]]:
+    """Send one request per window concurrently and concatenate the returned records."""
+
+    async def _request(window: T) -> List[Dict[str, Any]]:
+        parsed = await _acall_json_response(
+            build_messages(window),
+            model=model,
+            temperature=temperature,
+            cache_key=cache_key,
+            stream=stream,
+        )
+        records = parsed.get(result_key, [])
+        return [record for record in records if isinstance(record, dict)]
+
+    results = await asyncio.gather(*(_request(window) for window in windows))
+    return [record for window_records in results for record in window_records]
+
+
+def _run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """Drive ``coro`` to completion from synchronous code.
+
+    Every call runs on the shared background loop, which also works when an MCP tool is
+    invoked from inside another running event loop.
+    """
+
+    loop = _background_loop()
     try:
-        return json.loads(content)
-    except json.JSONDecodeError as exc:  # pragma: no cover - defensive
-        raise RuntimeError("OpenAI response was not valid JSON") from exc
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("LLM wrappers cannot block inside the shared LLM event loop")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str) -> Optional[Any]:
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        pass
+    except Exception:  # pragma: no cover - BPE files are downloaded on first use
+        return None
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:  # pragma: no cover - offline without a cached encoding
+        return None
 
 
-def _chunk_text(text: str, max_length: int) -> List[str]:
-    words = text.split()
-    if not words:
-        return []
+def _count_tokens(text: str, model: Optional[str] = None) -> int:
+    encoding = _encoding(model or _DEFAULT_MODEL)
+    if encoding is None:
+        # Roughly four characters per token for English prose.
+        return len(text) // 4 + 1
+    return len(encoding.encode(text))
+
+
+def _split_by_tokens(
+    items: Sequence[T],
+    render: Callable[[T], str],
+    budget: int = _WINDOW_TOKEN_BUDGET,
+    model: Optional[str] = None,
+) -> List[List[T]]:
+    """Greedily pack ``items`` into batches whose rendered size stays under ``budget`` tokens."""
+
+    batches: List[List[T]] = []
+    current: List[T] = []
+    used = 0
+
+    for item in items:
+        cost = _count_tokens(render(item), model)
+        if current and used + cost > budget:
+            batches.append(current)
+            current = []
+            used = 0
+        current.append(item)
+        used += cost
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
+def _joined_slice(text: str, start: int, end: int, joined_len: int, word_count: int) -> str:
+    chunk = text[start:end]
+    # Slicing is equivalent to joining the words whenever they are single-space separated.
+    if len(chunk) == joined_len and chunk.count(" ") == word_count - 1:
+        return chunk
+    return " ".join(chunk.split())
+
 
+def _chunk_text(text: str, max_length: int) -> List[str]:
     chunks: List[str] = []
-    current: List[str] = []
+    start = end = -1
     current_len = 0
+    word_count = 0
+
+    for match in _WORD_RE.finditer(text):
+        word_start, word_end = match.span()
+        word_len = word_end - word_start
+        if word_count and current_len + 1 + word_len > max_length:
+            chunks.append(_joined_slice(text, start, end, current_len, word_count))
+            word_count = 0
 
-    for word in words:
-        additional = len(word) + (1 if current else 0)
-        if current_len + additional > max_length and current:
-            chunks.append(" ".join(current))
-            current = [word]
-            current_len = len(word)
+        if word_count:
+            current_len += 1 + word_len
         else:
-            current.append(word)
-            current_len += additional
+            start = word_start
+            current_len = word_len
+        end = word_end
+        word_count += 1
 
-    if current:
-        chunks.append(" ".join(current))
+    if word_count:
+        chunks.append(_joined_slice(text, start, end, current_len, word_count))
 
     return chunks
 
 
+def _passage_payload(passages: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "passage_id": passage.get("id", ""),
+            "article_id": passage.get("article_id", ""),
+            "text": passage.get("text", ""),
+        }
+        for passage in passages
+    ]
+
+
+def unique_by_span(entities: Sequence[SpanRecord]) -> List[SpanRecord]:
+    """Keep the first entity for each distinct span, in input order."""
+
+    unique: Dict[object, SpanRecord] = {}
+    for entity in entities:
+        unique.setdefault(entity["span"], entity)
+    return list(unique.values())
+
+
+def _dedupe_passages(
+    passages: Sequence[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+    """Keep one passage per distinct text and group the copies under its id."""
+
+    representatives: Dict[bytes, str] = {}
+    unique: List[Dict[str, Any]] = []
+    groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+
+    for passage in passages:
+        digest = hashlib.sha1(passage.get("text", "").encode("utf-8")).digest()
+        representative = representatives.get(digest)
+        if representative is None:
+            representative = representatives[digest] = passage.get("id", "")
+            unique.append(passage)
+        groups[representative].append(passage)
+
+    return unique, groups
+
+
+def _expand_passage_records(
+    records: List[Dict[str, Any]],
+    groups: Dict[str, List[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """Copy per-passage LLM records onto every passage that shared the annotated text."""
+
+    expanded: List[Dict[str, Any]] = []
+    for record in records:
+        group = groups.get(record.get("passage_id", ""))
+        if not group:
+            expanded.append(record)
+            continue
+        for passage in group:
+            copy = {**record, "passage_id": passage.get("id", "")}
+            # Only entity records carry ``article_id``; topic records must not gain one.
+            if "article_id" in record:
+                copy["article_id"] = passage.get("article_id", "")
+            expanded.append(copy)
+    return expanded
+
+
+def _passage_messages(
+    system_prompt: Sequence[PromptMessage],
+    passages: Sequence[Dict[str, Any]],
+) -> List[PromptMessage]:
+    return _new_messages(system_prompt, {"passages": _passage_payload(passages)})
+
+
+def _render_passage(passage: Dict[str, Any]) -> str:
+    return _dumps(_passage_payload([passage])[0])
+
+
 def extract_passages_with_llm(
     article_id: str,
     content: str,
@@ -171,27 +649,25 @@ def extract_passages_with_llm(
     if not content.strip():
         return []
 
-    messages: List[PromptMessage] = list(_PASSAGE_SYSTEM_PROMPT)
-    messages.append(
-        _message(
-            "user",
-            json.dumps(
-                {
-                    "article_id": article_id,
-                    "max_length": max_length,
-                    "content": content,
-                }
-            ),
-        )
+    messages = _new_messages(
+        _PASSAGE_SYSTEM_PROMPT,
+        {
+            "article_id": article_id,
+            "max_length": max_length,
+            "content": content,
+        },
     )
 
-    parsed = _call_json_response(messages, model=model)
+    parsed = _call_json_response(
+        messages, model=model, cache_key=_PASSAGE_PROMPT_ID, stream=True
+    )
 
     raw_passages = parsed.get("passages", [])
     if not isinstance(raw_passages, list):
         raise RuntimeError("LLM returned passages in unexpected format")
 
     passages: List[Dict[str, Any]] = []
+    prefix = f"{article_id}-p"
     order = 0
 
     for raw in raw_passages:
@@ -205,17 +681,16 @@ def extract_passages_with_llm(
         if not text:
             continue
 
-        for chunk in _chunk_text(text, max_length) or [text]:
-            cleaned = chunk.strip()
-            if not cleaned:
-                continue
+        # ``text`` is stripped and non-empty, so it always yields at least one chunk of
+        # whitespace-free words joined by single spaces.
+        for chunk in _chunk_text(text, max_length):
             order += 1
             passages.append(
                 {
-                    "id": f"{article_id}-p{order}",
+                    "id": prefix + str(order),
                     "article_id": article_id,
                     "order": order,
-                    "text": cleaned,
+                    "text": chunk,
                 }
             )
 
@@ -229,61 +704,51 @@ def tag_entities_with_llm(
     if not resolved_entities:
         return []
 
-    messages: List[PromptMessage] = list(_TAGGING_SYSTEM_PROMPT)
-    messages.append(
-        _message("user", json.dumps({"resolved_entities": resolved_entities}))
-    )
+    messages = _new_messages(_TAGGING_SYSTEM_PROMPT, {"resolved_entities": resolved_entities})
 
-    parsed = _call_json_response(messages, model=model)
+    parsed = _call_json_response(messages, model=model, cache_key=_TAGGING_PROMPT_ID)
     tagged = parsed.get("tagged_entities", [])
     return [record for record in tagged if isinstance(record, dict)]
 
 
 def extract_entities_with_llm(passages: List[Dict[str, Any]], model: Optional[str] = None) -> List[Dict[str, Any]]:
-    messages: List[PromptMessage] = list(_ENTITY_SYSTEM_PROMPT)
+    return _run_coroutine(extract_entities_with_llm_async(passages, model=model))
 
-    for passage in passages:
-        messages.append(
-            _message(
-                "user",
-                json.dumps(
-                    {
-                        "passage_id": passage.get("id", ""),
-                        "article_id": passage.get("article_id", ""),
-                        "text": passage.get("text", ""),
-                    }
-                ),
-            )
-        )
 
-    parsed = _call_json_response(messages, model=model)
-    entities = parsed.get("entities", [])
-    return [entity for entity in entities if isinstance(entity, dict)]
+async def extract_entities_with_llm_async(
+    passages: List[Dict[str, Any]],
+    model: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Extract entities, fanning token-bounded passage windows out concurrently."""
+
+    unique, groups = _dedupe_passages(passages)
+    # Token counting is CPU-bound; keep it off the loop shared by concurrent requests.
+    windows = await asyncio.to_thread(_split_by_tokens, unique, _render_passage, model=model)
+    entities = await _gather_records(
+        windows,
+        partial(_passage_messages, _ENTITY_SYSTEM_PROMPT),
+        "entities",
+        model=model,
+        cache_key=_ENTITY_PROMPT_ID,
+    )
+    return _expand_passage_records(entities, groups)
 
 
 def classify_topics_with_llm(
     passages: List[Dict[str, Any]],
     model: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
-    messages: List[PromptMessage] = list(_TOPIC_SYSTEM_PROMPT)
-
-    for passage in passages:
-        messages.append(
-            _message(
-                "user",
-                json.dumps(
-                    {
-                        "passage_id": passage.get("id", ""),
-                        "article_id": passage.get("article_id", ""),
-                        "text": passage.get("text", ""),
-                    }
-                ),
-            )
+    unique, groups = _dedupe_passages(passages)
+    topics = _run_coroutine(
+        _gather_records(
+            _split_by_tokens(unique, _render_passage, model=model),
+            partial(_passage_messages, _TOPIC_SYSTEM_PROMPT),
+            "topics",
+            model=model,
+            cache_key=_TOPIC_PROMPT_ID,
         )
-
-    parsed = _call_json_response(messages, model=model)
-    topics = parsed.get("topics", [])
-    return [topic for topic in topics if isinstance(topic, dict)]
+    )
+    return _expand_passage_records(topics, groups)
 
 
 def resolve_entities_with_llm(
@@ -291,35 +756,83 @@ def resolve_entities_with_llm(
     context: str,
     model: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
-    messages: List[PromptMessage] = list(_DISAMBIGUATION_SYSTEM_PROMPT)
-    messages.append(_message("user", json.dumps({"context": context})))
-    messages.append(_message("user", json.dumps({"entities": entities})))
+    messages = _new_messages(
+        _DISAMBIGUATION_SYSTEM_PROMPT,
+        {"context": context},
+        {"entities": entities},
+    )
 
-    parsed = _call_json_response(messages, model=model)
+    parsed = _call_json_response(messages, model=model, cache_key=_DISAMBIGUATION_PROMPT_ID)
     resolved = parsed.get("resolved_entities", [])
     return [record for record in resolved if isinstance(record, dict)]
 
 
+TagGroup = Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]
+
+
+def _tag_groups(tags: List[Dict[str, Any]], passages: List[Dict[str, Any]]) -> List[TagGroup]:
+    """Group tags by canonical id together with the passages they reference.
+
+    Keeping a tag's mentions in one group means a split request never summarises the
+    same tag twice.
+    """
+
+    passage_lookup = {passage.get("id"): passage for passage in passages}
+    groups: Dict[str, TagGroup] = {}
+    referenced: Dict[str, Set[Any]] = defaultdict(set)
+
+    for tag in tags:
+        key = str(tag.get("canonical_id") or tag.get("entity", ""))
+        group_tags, group_passages = groups.setdefault(key, ([], []))
+        group_tags.append(tag)
+        passage_id = tag.get("passage_id")
+        passage = passage_lookup.get(passage_id)
+        if passage is not None and passage_id not in referenced[key]:
+            referenced[key].add(passage_id)
+            group_passages.append(passage)
+
+    return list(groups.values())
+
+
+def _tag_summary_messages(window: List[TagGroup]) -> List[PromptMessage]:
+    tags = [tag for group_tags, _ in window for tag in group_tags]
+    passages: Dict[Any, Dict[str, Any]] = {}
+    for _, group_passages in window:
+        for passage in group_passages:
+            passages.setdefault(passage.get("id"), passage)
+    return _new_messages(
+        _TAG_SUMMARY_SYSTEM_PROMPT,
+        {"tags": tags, "passages": list(passages.values())},
+    )
+
+
 def summarize_tags_with_llm(
     tags: List[Dict[str, Any]],
     passages: List[Dict[str, Any]],
     model: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
-    messages: List[PromptMessage] = list(_TAG_SUMMARY_SYSTEM_PROMPT)
-    messages.append(_message("user", json.dumps({"tags": tags, "passages": passages})))
-
-    parsed = _call_json_response(messages, model=model, temperature=0.2)
-    summaries = parsed.get("tag_summaries", [])
-    return [summary for summary in summaries if isinstance(summary, dict)]
+    windows = _split_by_tokens(_tag_groups(tags, passages), _dumps, model=model)
+    return _run_coroutine(
+        _gather_records(
+            windows,
+            _tag_summary_messages,
+            "tag_summaries",
+            model=model,
+            cache_key=_TAG_SUMMARY_PROMPT_ID,
+            temperature=0.2,
+            stream=True,
+        )
+    )
 
 
 def fact_check_with_llm(
     claims: List[str],
     model: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
-    messages: List[PromptMessage] = list(_FACT_CHECK_SYSTEM_PROMPT)
-    messages.append(_message("user", json.dumps({"claims": claims})))
+    messages = _new_messages(_FACT_CHECK_SYSTEM_PROMPT, {"claims": claims})
 
-    parsed = _call_json_response(messages, model=model, temperature=0.1)
+    parsed = _call_json_response(
+        messages, model=model, temperature=0.1, cache_key=_FACT_CHECK_PROMPT_ID
+    )
     checked = parsed.get("checked_claims", [])
     return [item for item in checked if isinstance(item, dict)]
@@ -0,0 +1,58 @@
+"""Process-pool fan-out for the rule-based per-passage tools."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Shipping a passage to a worker costs roughly half as much as scanning it, so only
+# batches well beyond a typical article run are worth the pool.
+_MIN_BATCH = 4096
+_CHUNK_SIZE = 1024
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def _worker_count() -> int:
+    # Opt-in: spawning workers costs more than most batches save, and "spawn" re-imports
+    # the calling script, which must then guard its entry point with ``__main__``.
+    try:
+        return int(os.getenv("NEWSROOM_PROCESS_WORKERS", "1") or 1)
+    except ValueError:
+        return 1
+
+
+def _pool(workers: int) -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            # "spawn" keeps workers clear of the server's event-loop and client threads.
+            _POOL = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _POOL
+
+
+def map_batches(fn: Callable[[Sequence[T]], List[R]], items: Sequence[T]) -> List[R]:
+    """Apply ``fn`` to ``items`` in order, spreading large batches across processes.
+
+    ``fn`` must be a picklable module-level function mapping a slice of items to a list of
+    results. Small batches, or a single configured worker, run in-process.
+    """
+
+    workers = _worker_count()
+    if workers < 2 or len(items) < _MIN_BATCH:
+        return fn(items)
+
+    chunks = [items[start : start + _CHUNK_SIZE] for start in range(0, len(items), _CHUNK_SIZE)]
+    results: List[R] = []
+    for chunk_results in _pool(workers).map(fn, chunks):
+        results.extend(chunk_results)
+    return results
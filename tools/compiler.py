@@ -1,29 +1,36 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Callable, Dict, List
 
 from newsroom import RankedStory
 
 
+def _text_line(story: RankedStory) -> str:
+    url_part = f" {story['url']}" if story["url"] else ""
+    return f"- {story['title']}{url_part} — {story['reason']} (score: {story['score']:.1f})"
+
+
+def _markdown_line(story: RankedStory) -> str:
+    if not story["url"]:
+        return _text_line(story)
+    return f"- [{story['title']}]({story['url']}) — {story['reason']} (score: {story['score']:.1f})"
+
+
+_FORMATTERS: Dict[str, Callable[[RankedStory], str]] = {
+    "markdown": _markdown_line,
+    "text": _text_line,
+}
+
+
 def compile_digest(
     ranked_summaries: List[RankedStory],
     format: str = "markdown",
 ) -> Dict[str, str]:
     """Format ranked summaries into a newsroom digest."""
 
-    if format not in {"markdown", "text"}:
+    formatter = _FORMATTERS.get(format)
+    if formatter is None:
         raise ValueError("Only 'markdown' and 'text' are supported in the demo")
 
-    lines: List[str] = []
-    for story in ranked_summaries:
-        title = story["title"]
-        reason = story["reason"]
-        score = f"score: {story['score']:.1f}"
-        if format == "markdown" and story["url"]:
-            lines.append(f"- [{title}]({story['url']}) — {reason} ({score})")
-        else:
-            url_part = f" {story['url']}" if story["url"] else ""
-            lines.append(f"- {title}{url_part} — {reason} ({score})")
-
-    digest = "\n".join(lines)
+    digest = "\n".join(formatter(story) for story in ranked_summaries)
     return {"digest": digest, "format": format, "item_count": str(len(ranked_summaries))}
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import sys
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 from newsroom import EntityMention, ResolvedEntity
-from newsroom.llm import resolve_entities_with_llm
+from newsroom.llm import resolve_entities_with_llm, unique_by_span
 
 _CANONICAL_IDS = {
     "OpenAI": "Q12345",
@@ -17,14 +18,24 @@ _CANONICAL_IDS = {
 }
 
 
+@lru_cache(maxsize=4096)
+def _fallback_id(span: str) -> str:
+    return f"Q{abs(hash(span)) % 10000}"
+
+
 def _rule_based_disambiguation(entities: List[EntityMention]) -> List[ResolvedEntity]:
     resolved: List[ResolvedEntity] = []
     for entity in entities:
-        canonical_id = _CANONICAL_IDS.get(entity["span"], f"Q{abs(hash(entity['span'])) % 10000}")
-        confidence = 0.95 if entity["span"] in _CANONICAL_IDS else 0.5
+        span = entity["span"]
+        canonical_id = _CANONICAL_IDS.get(span)
+        if canonical_id is None:
+            canonical_id = _fallback_id(span)
+            confidence = 0.5
+        else:
+            confidence = 0.95
         resolved.append(
             {
-                "span": entity["span"],
+                "span": span,
                 "canonical_id": canonical_id,
                 "confidence": confidence,
                 "type": entity["type"],
@@ -35,6 +46,28 @@ def _rule_based_disambiguation(entities: List[EntityMention]) -> List[ResolvedEn
     return resolved
 
 
+def _expand_resolutions(
+    entities: List[EntityMention],
+    resolutions: List[Dict[str, Any]],
+) -> List[ResolvedEntity]:
+    by_span = {record.get("span"): record for record in resolutions}
+    expanded: List[ResolvedEntity] = []
+    for entity in entities:
+        record = by_span.get(entity["span"])
+        if record is None:
+            continue
+        expanded.append(
+            {
+                **record,  # type: ignore[typeddict-item]
+                "span": entity["span"],
+                "type": record.get("type", entity["type"]),
+                "passage_id": entity["passage_id"],
+                "article_id": entity["article_id"],
+            }
+        )
+    return expanded
+
+
 def disambiguate_entities(
     entities: List[EntityMention],
     context: str = "",
@@ -46,13 +79,16 @@ def disambiguate_entities(
 
     if llm_mode and entities:
         try:
-            resolved_llm = resolve_entities_with_llm(entities, context=context, model=model)
+            # Each span is linked once; the result is copied back onto every mention.
+            resolved_llm = resolve_entities_with_llm(
+                unique_by_span(entities), context=context, model=model
+            )
         except RuntimeError as exc:
             if not fallback_on_error:
                 raise
             print(f"[newsroom] llm disambiguation fallback: {exc}", file=sys.stderr)
         else:
-            return {"resolved_entities": resolved_llm}  # type: ignore[return-value]
+            return {"resolved_entities": _expand_resolutions(entities, resolved_llm)}
 
     resolved = _rule_based_disambiguation(entities)
     return {"resolved_entities": resolved}
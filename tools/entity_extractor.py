@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import sys
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from newsroom import EntityMention, Passage
 from newsroom.llm import extract_entities_with_llm
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None  # type: ignore[assignment]
+
 _KNOWN_ENTITIES = {
     "OpenAI": "ORG",
     "New York City": "LOCATION",
@@ -16,22 +21,50 @@ _KNOWN_ENTITIES = {
     "Priya Das": "PERSON",
 }
 
+# (span, type) pairs in dictionary order; the automaton stores indices into this table.
+_ENTITY_TABLE: Tuple[Tuple[str, str], ...] = tuple(_KNOWN_ENTITIES.items())
+
+
+def _build_automaton() -> Optional["ahocorasick.Automaton"]:
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for rank, (entity, _) in enumerate(_ENTITY_TABLE):
+        automaton.add_word(entity, rank)
+    automaton.make_automaton()
+    return automaton
+
+
+_AUTOMATON = _build_automaton()
+
+
+def _matched_entities(text: str) -> List[Tuple[str, str]]:
+    """Return known entities found in ``text`` in dictionary order, once each."""
+
+    if _AUTOMATON is None:
+        return [(entity, entity_type) for entity, entity_type in _ENTITY_TABLE if entity in text]
+
+    return [_ENTITY_TABLE[rank] for rank in sorted({rank for _, rank in _AUTOMATON.iter(text)})]
+
+
+def _scan_passage(passage: Passage) -> List[EntityMention]:
+    text = passage["text"]
+    return [
+        {
+            "span": entity,
+            "type": entity_type,  # type: ignore[typeddict-item]
+            "passage_id": passage["id"],
+            "article_id": passage["article_id"],
+            "context": text,
+        }
+        for entity, entity_type in _matched_entities(text)
+    ]
+
 
 def _rule_based_entities(passages: List[Passage]) -> List[EntityMention]:
     mentions: List[EntityMention] = []
     for passage in passages:
-        text = passage["text"]
-        for entity, entity_type in _KNOWN_ENTITIES.items():
-            if entity in text:
-                mentions.append(
-                    {
-                        "span": entity,
-                        "type": entity_type,
-                        "passage_id": passage["id"],
-                        "article_id": passage["article_id"],
-                        "context": text,
-                    }
-                )
+        mentions.extend(_scan_passage(passage))
     return mentions
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 import sys
 from typing import Dict, List, Optional
 
@@ -26,6 +27,13 @@ _KNOWN_FACTS = {
     },
 }
 
+# A single alternation scans each lowercased claim once regardless of how many cues are
+# known. Each cue has its own group, so ``match.lastindex`` picks the verdict directly.
+# IGNORECASE is avoided on purpose: its Unicode case folding also matches text such as
+# "newſroom" whose lower() is not a known cue.
+_FACTS_RE = re.compile("|".join(f"({re.escape(cue.lower())})" for cue in _KNOWN_FACTS))
+_FACTS_VERDICTS = (None, *_KNOWN_FACTS.values())
+
 
 def fact_check(
     claims: List[str],
@@ -48,12 +56,10 @@ def fact_check(
     checked = []
     for claim in claims:
         result = {"claim": claim, "status": "unverified", "references": []}
-        lowered = claim.lower()
-        for cue, verdict in _KNOWN_FACTS.items():
-            if cue in lowered:
-                result["status"] = verdict["status"]
-                result["references"] = verdict["references"]
-                break
+        match = _FACTS_RE.search(claim.lower())
+        if match:
+            verdict = _FACTS_VERDICTS[match.lastindex]  # type: ignore[index]
+            result.update(status=verdict["status"], references=verdict["references"])
         checked.append(result)
 
     return {"checked_claims": checked}
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import atexit
 import html
 import json
-from datetime import datetime, timezone
+import re
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from heapq import nlargest
+from io import BytesIO
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 from xml.etree import ElementTree
 
@@ -13,9 +22,63 @@ import httpx
 
 from newsroom import Article
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - optional dependency
+    etree = None  # type: ignore[assignment]
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+except ImportError:  # pragma: no cover - optional dependency
+    _HTTP2_AVAILABLE = False
+else:
+    _HTTP2_AVAILABLE = True
+
 _DATA_PATH = Path(__file__).resolve().parents[1] / "resources" / "sample_articles.json"
 
+# Live feeds give up after this many seconds; callers may only shorten the deadline.
+_FEED_TIMEOUT = 10.0
+_MIN_FEED_TIMEOUT = 0.1
+
+# Whole-second UTC timestamps as stored in the corpus and emitted for RSS items.
+_CANONICAL_UTC_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:Z|\+00:00)")
+
+
+@dataclass(frozen=True, slots=True)
+class _StoredArticle:
+    """Immutable, slotted form of :class:`Article` held by the corpus and feed caches."""
+
+    id: str
+    source: str
+    title: str
+    url: str
+    timestamp: str
+    author: str
+    content: str
+
+    def to_article(self) -> Article:
+        return {
+            "id": self.id,
+            "source": self.source,
+            "title": self.title,
+            "url": self.url,
+            "timestamp": self.timestamp,
+            "author": self.author,
+            "content": self.content,
+        }
+
+
+# url -> (ETag, Last-Modified, parse limit, parsed articles) for conditional GETs.
+_FEED_CACHE: Dict[str, Tuple[Optional[str], Optional[str], int, List[_StoredArticle]]] = {}
+_FEED_CACHE_LOCK = threading.Lock()
+
 
+@lru_cache(maxsize=4096)
 def _parse_iso8601(value: str) -> datetime:
     """Parse ISO 8601 strings that may use a trailing Z for UTC."""
 
@@ -25,14 +88,65 @@ def _parse_iso8601(value: str) -> datetime:
     return dt
 
 
+@lru_cache(maxsize=1)
+def _http_client() -> httpx.Client:
+    """Return the process-wide feed client so keep-alive connections are reused."""
+
+    # ``http2`` and ``limits`` must be set on the transport; httpx ignores the client-level
+    # arguments when an explicit transport is supplied.
+    transport = httpx.HTTPTransport(
+        retries=2,
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
+    client = httpx.Client(
+        timeout=_FEED_TIMEOUT,
+        headers={"User-Agent": "newsroom-server/0.1"},
+        follow_redirects=True,
+        transport=transport,
+    )
+    atexit.register(client.close)
+    return client
+
+
+def _get_with_deadline(url: str, headers: Dict[str, str], timeout: float) -> httpx.Response:
+    """GET ``url``, giving up once ``timeout`` seconds have passed in total.
+
+    httpx timeouts apply per connect/read operation, and the shared transport retries
+    failed connects, so a dead host could otherwise hold the caller for several times
+    ``timeout``. The request runs on a daemon thread and is abandoned at the deadline; it
+    still ends on its own per-operation timeouts.
+    """
+
+    result: "Future[httpx.Response]" = Future()
+
+    def _run() -> None:
+        try:
+            result.set_result(_http_client().get(url, headers=headers, timeout=timeout))
+        except BaseException as exc:  # noqa: BLE001 - re-raised in the caller's thread
+            result.set_exception(exc)
+
+    threading.Thread(target=_run, name="newsroom-feed", daemon=True).start()
+    try:
+        return result.result(timeout=timeout)
+    except TimeoutError as exc:
+        raise httpx.TimeoutException(f"no response within {timeout:g}s") from exc
+
+
 def _looks_like_url(value: str) -> bool:
     parsed = urlparse(value)
     return bool(parsed.scheme and parsed.netloc)
 
 
 def _normalise_timestamp(value: Optional[str]) -> str:
-    if not value:
-        return datetime.now(tz=timezone.utc).isoformat()
+    normalised = _normalise_pub_date(value) if value else None
+    # Missing or unparseable dates fall back to "now", which must stay outside the cache.
+    return normalised or datetime.now(tz=timezone.utc).isoformat()
+
+
+@lru_cache(maxsize=4096)
+def _normalise_pub_date(value: str) -> Optional[str]:
+    """Convert an RFC 822 or ISO 8601 date to UTC ISO format, or ``None`` if unparseable."""
 
     try:
         dt = parsedate_to_datetime(value)
@@ -40,7 +154,7 @@ def _normalise_timestamp(value: Optional[str]) -> str:
         try:
             return _parse_iso8601(value).isoformat()
         except ValueError:
-            return datetime.now(tz=timezone.utc).isoformat()
+            return None
 
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
@@ -54,69 +168,199 @@ def _extract_text(element: ElementTree.Element, tag: str) -> Optional[str]:
     return child.text.strip()
 
 
-def _parse_rss_feed(feed_text: str, source: str, limit: int) -> List[Article]:
+def _item_to_article(item: ElementTree.Element, source: str) -> Article:
+    link = _extract_text(item, "link") or source
+    guid = _extract_text(item, "guid") or link
+    title = html.unescape(_extract_text(item, "title") or "Untitled story")
+    author = _extract_text(item, "author") or "Unknown"
+    description = html.unescape(_extract_text(item, "description") or "")
+    pub_date = _extract_text(item, "pubDate")
+
+    return {
+        "id": guid,
+        "source": source,
+        "title": title,
+        "url": link,
+        "timestamp": _normalise_timestamp(pub_date),
+        "author": author,
+        "content": description,
+    }
+
+
+def _iterparse_rss_feed(feed: bytes, source: str, limit: int) -> List[Article]:
+    """Stream ``<item>`` elements with lxml, stopping once ``limit`` items are read."""
+
+    articles: List[Article] = []
+    channel = None
+    events = etree.iterparse(BytesIO(feed), events=("start", "end"), tag=("channel", "item"))
+
     try:
-        root = ElementTree.fromstring(feed_text)
-    except ElementTree.ParseError as exc:
+        for event, element in events:
+            parent = element.getparent()
+            if element.tag == "channel":
+                is_top_level = parent is not None and parent.getparent() is None
+                if event == "start" and channel is None and is_top_level:
+                    channel = element
+                continue
+            if event != "end" or channel is None or parent is not channel:
+                continue
+
+            articles.append(_item_to_article(element, source))
+            # Drop parsed items so memory stays flat on long feeds.
+            element.clear()
+            while element.getprevious() is not None:
+                del parent[0]
+
+            if limit and len(articles) >= limit:
+                break
+    except etree.XMLSyntaxError as exc:
         raise ValueError(f"Unable to parse RSS feed for source '{source}': {exc}") from exc
 
-    channel = root.find("channel")
     if channel is None:
         raise ValueError(f"RSS feed for source '{source}' does not contain a <channel> node")
+    return articles
+
+
+def _stream_rss_feed(feed: bytes, source: str, limit: int) -> List[Article]:
+    """ElementTree counterpart of :func:`_iterparse_rss_feed` for when lxml is missing."""
 
     articles: List[Article] = []
-    for item in channel.findall("item")[:limit or None]:
-        link = _extract_text(item, "link") or source
-        guid = _extract_text(item, "guid") or link
-        title = html.unescape(_extract_text(item, "title") or "Untitled story")
-        author = _extract_text(item, "author") or "Unknown"
-        description = html.unescape(_extract_text(item, "description") or "")
-        pub_date = _extract_text(item, "pubDate")
-
-        article: Article = {
-            "id": guid,
-            "source": source,
-            "title": title,
-            "url": link,
-            "timestamp": _normalise_timestamp(pub_date),
-            "author": author,
-            "content": description,
-        }
-        articles.append(article)
+    channel = None
+    in_channel = False
+    depth = 0
 
+    try:
+        for event, element in ElementTree.iterparse(BytesIO(feed), events=("start", "end")):
+            if event == "start":
+                depth += 1
+                # Only the first <channel> directly under the root is read.
+                if channel is None and depth == 2 and element.tag == "channel":
+                    channel = element
+                    in_channel = True
+                continue
+
+            depth -= 1
+            if element is channel:
+                in_channel = False
+            if not in_channel or depth != 2 or element.tag != "item":
+                continue
+
+            articles.append(_item_to_article(element, source))
+            # Drop parsed items so memory stays flat on long feeds.
+            channel.remove(element)  # type: ignore[union-attr]
+
+            if limit and len(articles) >= limit:
+                break
+    except ElementTree.ParseError as exc:
+        raise ValueError(f"Unable to parse RSS feed for source '{source}': {exc}") from exc
+
+    if channel is None:
+        raise ValueError(f"RSS feed for source '{source}' does not contain a <channel> node")
     return articles
 
 
-def _load_articles() -> Dict[str, List[Article]]:
-    if not _DATA_PATH.exists():
+def _parse_rss_feed(feed: bytes, source: str, limit: int) -> List[Article]:
+    if etree is not None:
+        return _iterparse_rss_feed(feed, source, limit)
+    return _stream_rss_feed(feed, source, limit)
+
+
+def _fetch_feed(url: str, limit: int, timeout: float) -> List[_StoredArticle]:
+    """Download and parse ``url``, revalidating a cached copy with a conditional GET."""
+
+    with _FEED_CACHE_LOCK:
+        cached = _FEED_CACHE.get(url)
+
+    headers: Dict[str, str] = {}
+    # A copy parsed with a smaller limit cannot answer a larger request, so only
+    # revalidate entries that cover ``limit``.
+    if cached is not None and (not cached[2] or (limit and limit <= cached[2])):
+        etag, last_modified, _, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    try:
+        response = _get_with_deadline(url, headers, timeout)
+        if headers and response.status_code == 304:
+            return cached[3][: limit or None]  # type: ignore[index]
+        response.raise_for_status()
+    except httpx.HTTPError as exc:
+        raise RuntimeError(f"Failed to fetch RSS feed '{url}': {exc}") from exc
+
+    articles = [
+        _StoredArticle(**article)
+        for article in _parse_rss_feed(response.content, source=url, limit=limit)
+    ]
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        with _FEED_CACHE_LOCK:
+            _FEED_CACHE[url] = (etag, last_modified, limit, articles)
+    return articles
+
+
+def _load_articles() -> Dict[str, List[_StoredArticle]]:
+    """Return the demo corpus, re-reading it only when the file changes on disk.
+
+    The mapping is shared between calls; convert records with ``to_article`` before
+    handing them out.
+    """
+
+    try:
+        mtime = _DATA_PATH.stat().st_mtime
+    except FileNotFoundError:
         return {}
+    return _load_articles_cached(mtime)
+
 
-    with _DATA_PATH.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
+@lru_cache(maxsize=1)
+def _load_articles_cached(mtime: float) -> Dict[str, List[_StoredArticle]]:
+    raw_bytes = _DATA_PATH.read_bytes()
+    data = orjson.loads(raw_bytes) if orjson is not None else json.loads(raw_bytes)
 
-    loaded: Dict[str, List[Article]] = {}
+    loaded: Dict[str, List[_StoredArticle]] = {}
     for source, articles in data.get("sources", {}).items():
-        loaded[source] = []
-        for raw in articles:
-            article: Article = {
-                "id": raw["id"],
-                "source": source,
-                "title": raw["title"],
-                "url": raw["url"],
-                "timestamp": raw["timestamp"],
-                "author": raw.get("author", "Unknown"),
-                "content": raw["content"],
-            }
-            loaded[source].append(article)
+        loaded[source] = [
+            _StoredArticle(
+                id=raw["id"],
+                source=source,
+                title=raw["title"],
+                url=raw["url"],
+                timestamp=raw["timestamp"],
+                author=raw.get("author", "Unknown"),
+                content=raw["content"],
+            )
+            for raw in articles
+        ]
     return loaded
 
 
-def _filter_since(articles: Iterable[Article], since: Optional[str]) -> List[Article]:
+def _filter_since(
+    articles: Iterable[_StoredArticle], since: Optional[str]
+) -> List[_StoredArticle]:
     if not since:
         return list(articles)
 
-    since_dt = _parse_iso8601(since)
-    return [article for article in articles if _parse_iso8601(article["timestamp"]) >= since_dt]
+    since_dt = _parse_iso8601(since).astimezone(timezone.utc)
+    # Canonical timestamps carry whole seconds, so rounding ``since`` up to the next second
+    # lets their "YYYY-MM-DDTHH:MM:SS" prefix be compared as plain strings.
+    since_ceil = since_dt.replace(microsecond=0)
+    if since_dt.microsecond:
+        since_ceil += timedelta(seconds=1)
+    since_key = since_ceil.isoformat()[:19]
+
+    filtered: List[_StoredArticle] = []
+    for article in articles:
+        timestamp = article.timestamp
+        if _CANONICAL_UTC_RE.fullmatch(timestamp):
+            keep = timestamp[:19] >= since_key
+        else:
+            keep = _parse_iso8601(timestamp) >= since_dt
+        if keep:
+            filtered.append(article)
+    return filtered
 
 
 def fetch_articles(source: str, since: Optional[str] = None, limit: int = 10) -> Dict[str, List[Article]]:
@@ -127,25 +371,27 @@ def fetch_articles(source: str, since: Optional[str] = None, limit: int = 10) ->
     offline.
     """
 
+    return fetch_articles_within(source, _FEED_TIMEOUT, since=since, limit=limit)
+
+
+def fetch_articles_within(
+    source: str,
+    timeout: float,
+    since: Optional[str] = None,
+    limit: int = 10,
+) -> Dict[str, List[Article]]:
+    """Variant of :func:`fetch_articles` that gives up on live feeds after ``timeout`` seconds.
+
+    It is not registered as an MCP tool; the demo uses it to fall back to the sample corpus
+    quickly. ``timeout`` is clamped to between 0.1 and 10 seconds.
+    """
+
     if _looks_like_url(source):
-        try:
-            transport = httpx.HTTPTransport(retries=2)
-            with httpx.Client(
-                timeout=10.0,
-                headers={"User-Agent": "newsroom-server/0.1"},
-                follow_redirects=True,
-                http2=False,
-                transport=transport,
-            ) as client:
-                response = client.get(source)
-                response.raise_for_status()
-        except httpx.HTTPError as exc:
-            raise RuntimeError(f"Failed to fetch RSS feed '{source}': {exc}") from exc
-
-        articles = _parse_rss_feed(response.text, source=source, limit=limit)
+        timeout = min(max(timeout, _MIN_FEED_TIMEOUT), _FEED_TIMEOUT)
+        articles = _fetch_feed(source, limit=limit, timeout=timeout)
         articles = _filter_since(articles, since)
-        articles = sorted(articles, key=lambda item: item["timestamp"], reverse=True)
-        return {"articles": articles[:limit]}
+        newest = nlargest(limit, articles, key=attrgetter("timestamp"))
+        return {"articles": [article.to_article() for article in newest]}
 
     articles_by_source = _load_articles()
     if source not in articles_by_source:
@@ -154,5 +400,5 @@ def fetch_articles(source: str, since: Optional[str] = None, limit: int = 10) ->
         )
 
     articles = _filter_since(articles_by_source[source], since)
-    articles = sorted(articles, key=lambda item: item["timestamp"], reverse=True)
-    return {"articles": articles[:limit]}
+    newest = nlargest(limit, articles, key=attrgetter("timestamp"))
+    return {"articles": [article.to_article() for article in newest]}
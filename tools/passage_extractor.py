@@ -6,11 +6,42 @@ from typing import Dict, List, Optional
 from newsroom import Passage
 from newsroom.llm import extract_passages_with_llm
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+# Below this many words the plain loop beats NumPy's array setup cost.
+_NUMPY_MIN_WORDS = 2000
+
+
+def _chunk_words_numpy(words: List[str], max_length: int) -> List[str]:
+    """Greedy word packing driven by a prefix sum of word lengths plus separators."""
+
+    # offsets[i] is the joined length of words[:i] plus one trailing space, so words[s:e]
+    # fit in a chunk exactly when offsets[e] - offsets[s] - 1 <= max_length.
+    offsets = np.zeros(len(words) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, words), dtype=np.int64, count=len(words)) + 1, out=offsets[1:])
+    ends = np.searchsorted(offsets, offsets + max_length + 1, side="right") - 1
+
+    chunks: List[str] = []
+    start = 0
+    if ends[0] == 0:
+        # Matches the loop below, which flushes an empty chunk before an oversized first word.
+        chunks.append("")
+    while start < len(words):
+        end = max(int(ends[start]), start + 1)
+        chunks.append(" ".join(words[start:end]))
+        start = end
+    return chunks
+
 
 def _chunk_text(text: str, max_length: int) -> List[str]:
     words = text.split()
     if not words:
         return []
+    if np is not None and len(words) >= _NUMPY_MIN_WORDS:
+        return _chunk_words_numpy(words, max_length)
 
     chunks: List[str] = []
     current: List[str] = []
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import math
+import re
 import sys
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Set
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
 from newsroom import Article, RankedStory, TagSummary
 
@@ -12,6 +14,7 @@ def _ensure_str_set(values: Iterable[Any]) -> Set[str]:
     return {str(value).strip().lower() for value in values if isinstance(value, str) and value.strip()}
 
 
+@lru_cache(maxsize=4096)
 def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
     if not value or not isinstance(value, str):
         return None
@@ -61,6 +64,56 @@ def _recency_weight(timestamp: Optional[str], *, now: Optional[datetime] = None)
     return math.exp(-age_hours / 48.0)
 
 
+class _ArticleFeatures(NamedTuple):
+    """Per-article ranking inputs, computed once however many summaries cite the article."""
+
+    blocked: bool
+    recency: float
+    favourite: bool
+    has_title: bool  # Otherwise the summary tag stands in for the title
+    title: Optional[str]
+    url: str
+    reasons: Tuple[str, ...]
+
+
+_UNKNOWN_ARTICLE = _ArticleFeatures(False, 0.0, False, False, None, "", ())
+
+
+def _article_features(
+    article: Article,
+    *,
+    now: datetime,
+    favourite_sources: Set[str],
+    blocked_sources: Set[str],
+) -> _ArticleFeatures:
+    source = article.get("source")
+    source_lower = source.lower() if isinstance(source, str) else ""
+    if source_lower and source_lower in blocked_sources:
+        return _ArticleFeatures(True, 0.0, False, False, None, "", ())
+
+    timestamp = article.get("timestamp") if isinstance(article.get("timestamp"), str) else None
+    recency = _recency_weight(timestamp, now=now)
+    favourite = bool(favourite_sources) and source_lower in favourite_sources
+
+    reasons: List[str] = []
+    if recency > 0.5:
+        reasons.append("Recent coverage")
+    if favourite:
+        reasons.append("Favourite source")
+    if source:
+        reasons.append(f"Source: {source}")
+
+    return _ArticleFeatures(
+        blocked=False,
+        recency=recency,
+        favourite=favourite,
+        has_title="title" in article,
+        title=article.get("title"),
+        url=article.get("url", ""),
+        reasons=tuple(reasons),
+    )
+
+
 def _highlight_density(highlights: List[str]) -> float:
     combined = " ".join(highlights)
     words = combined.split()
@@ -84,11 +137,19 @@ def personalize_and_rank(
     priority_entities = _ensure_str_set(user_profile.get("priority_entities", []))
     favourite_sources = _ensure_str_set(user_profile.get("favourite_sources", []))
     blocked_sources = _ensure_str_set(user_profile.get("blocked_sources", []))
+    # One alternation finds any preferred topic in a single pass over the text.
+    topic_re = (
+        re.compile("|".join(map(re.escape, sorted(preferred_topics, key=len, reverse=True))))
+        if preferred_topics
+        else None
+    )
 
     article_lookup = {article["id"]: article for article in articles or [] if article.get("id")}
 
     ranked: List[RankedStory] = []
     now = datetime.now(tz=timezone.utc)
+    # Articles cited by several summaries share one feature computation.
+    feature_lookup: Dict[str, _ArticleFeatures] = {}
 
     for raw_summary in summaries:
         summary = _validate_summary(raw_summary)
@@ -99,69 +160,58 @@ def personalize_and_rank(
         category_lower = summary["category"].lower()
         highlight_text = " ".join(summary["highlights"]).lower()
 
-        topic_match = any(topic in category_lower for topic in preferred_topics)
+        topic_match = bool(topic_re and topic_re.search(category_lower))
         entity_match = summary_tag_lower in priority_entities
-        keyword_match = any(topic in highlight_text for topic in preferred_topics)
+        keyword_match = bool(topic_re and topic_re.search(highlight_text))
         highlight_strength = _highlight_density(summary["highlights"])
 
-        for article_id in summary["article_ids"]:
-            article = article_lookup.get(article_id)
-            source_lower = article["source"].lower() if article and isinstance(article.get("source"), str) else ""
+        # Everything that depends only on the summary is scored once, not per article.
+        base_score = 0.6  # Baseline score ensuring deterministic ordering
+        base_reasons: List[str] = [f"Entity focus: {summary['tag']}"]
 
-            if source_lower and source_lower in blocked_sources:
+        if topic_match:
+            base_score += 1.0
+            base_reasons.append("Matches preferred topic")
+        if entity_match:
+            base_score += 1.2
+            base_reasons.append("Priority entity")
+        if keyword_match and not topic_match:
+            base_score += 0.5
+            base_reasons.append("Highlight matches interest")
+
+        base_score += 0.8 * highlight_strength
+        if highlight_strength > 0.6:
+            base_reasons.append("Rich highlight")
+
+        for article_id in summary["article_ids"]:
+            features = feature_lookup.get(article_id)
+            if features is None:
+                article = article_lookup.get(article_id)
+                features = feature_lookup[article_id] = (
+                    _article_features(
+                        article,
+                        now=now,
+                        favourite_sources=favourite_sources,
+                        blocked_sources=blocked_sources,
+                    )
+                    if article
+                    else _UNKNOWN_ARTICLE
+                )
+
+            if features.blocked:
                 continue
 
-            score = 0.6  # Baseline score ensuring deterministic ordering
-            reasons: List[str] = [f"Entity focus: {summary['tag']}"]
-
-            if topic_match:
-                score += 1.0
-                reasons.append("Matches preferred topic")
-            if entity_match:
-                score += 1.2
-                reasons.append("Priority entity")
-            if keyword_match and not topic_match:
-                score += 0.5
-                reasons.append("Highlight matches interest")
-
-            score += 0.8 * highlight_strength
-            if highlight_strength > 0.6:
-                reasons.append("Rich highlight")
-
-            if article:
-                timestamp = article.get("timestamp") if isinstance(article.get("timestamp"), str) else None
-                recency = _recency_weight(timestamp, now=now)
-                score += 0.7 * recency
-                if recency > 0.5:
-                    reasons.append("Recent coverage")
-
-                if favourite_sources and source_lower in favourite_sources:
-                    score += 0.4
-                    reasons.append("Favourite source")
-
-                title = article.get("title", summary["tag"])
-                url = article.get("url", "")
-                reason_source = article.get("source")
-            else:
-                title = summary["tag"]
-                url = ""
-                reason_source = None
+            score = base_score + 0.7 * features.recency
+            if features.favourite:
+                score += 0.4
 
             ranked.append(
                 {
                     "article_id": article_id,
-                    "title": title,
-                    "url": url,
+                    "title": features.title if features.has_title else summary["tag"],
+                    "url": features.url,
                     "score": round(score, 3),
-                    "reason": ", ".join(
-                        filter(
-                            None,
-                            [
-                                *reasons,
-                                f"Source: {reason_source}" if reason_source else None,
-                            ],
-                        )
-                    ),
+                    "reason": ", ".join([*base_reasons, *features.reasons]),
                 }
             )
 
@@ -15,18 +15,28 @@ def rank_stories(
     preferred_topics = {topic.lower() for topic in user_profile.get("preferred_topics", [])}
     blocked_sources = {source.lower() for source in user_profile.get("blocked_sources", [])}
     article_lookup = {article["id"]: article for article in articles or []}
+    # Filled on first use so articles that no summary cites are never inspected.
+    source_lower_lookup: Dict[str, str] = {}
 
     ranked: List[RankedStory] = []
     for summary in summaries:
         article_ids = [article_id for article_id in summary["article_ids"] if article_id]
+        topic_match: Optional[bool] = None
         for article_id in article_ids:
             article = article_lookup.get(article_id)
-            if article and article["source"].lower() in blocked_sources:
-                continue
+            if article:
+                source_lower = source_lower_lookup.get(article_id)
+                if source_lower is None:
+                    source_lower = source_lower_lookup[article_id] = article["source"].lower()
+                if source_lower in blocked_sources:
+                    continue
 
             score = 1.0
             reason_parts = [f"Entity: {summary['tag']}"]
-            if any(topic in summary["category"].lower() for topic in preferred_topics):
+            if topic_match is None:
+                category_lower = summary["category"].lower()
+                topic_match = any(topic in category_lower for topic in preferred_topics)
+            if topic_match:
                 score += 1.0
                 reason_parts.append("Matches preferred topic")
 
@@ -1,22 +1,17 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Sequence
 
 from newsroom import Passage, SentimentScore
+from newsroom.cues import scan_cues
+from newsroom.parallel import map_batches
 
-_POSITIVE_CUES = {"improved", "expanding", "better", "engaged", "helps", "support"}
-_NEGATIVE_CUES = {"concern", "risk", "problem", "delay"}
-
-
-def analyze_sentiment(passages: List[Passage]) -> Dict[str, List[SentimentScore]]:
-    """Analyze sentiment and stance of passages using a keyword lexicon."""
 
+def _score_passages(passages: Sequence[Passage]) -> List[SentimentScore]:
     scores: List[SentimentScore] = []
 
     for passage in passages:
-        text_lower = passage["text"].lower()
-        positive = sum(1 for cue in _POSITIVE_CUES if cue in text_lower)
-        negative = sum(1 for cue in _NEGATIVE_CUES if cue in text_lower)
+        positive, negative, _ = scan_cues(passage["text"])
         delta = positive - negative
 
         if delta > 0:
@@ -38,4 +33,10 @@ def analyze_sentiment(passages: List[Passage]) -> Dict[str, List[SentimentScore]
             }
         )
 
-    return {"sentiment_scores": scores}
+    return scores
+
+
+def analyze_sentiment(passages: List[Passage]) -> Dict[str, List[SentimentScore]]:
+    """Analyze sentiment and stance of passages using a keyword lexicon."""
+
+    return {"sentiment_scores": map_batches(_score_passages, passages)}
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import sys
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from newsroom import Passage, TagSummary, TaggedEntity
 from newsroom.llm import summarize_tags_with_llm
 
 
-def _build_highlight(text: str, limit: int = 160) -> str:
+def _build_highlight_by_words(text: str, limit: int) -> str:
     words = text.split()
     highlight: List[str] = []
     length = 0
@@ -25,6 +25,24 @@ def _build_highlight(text: str, limit: int = 160) -> str:
     return snippet or text[:limit]
 
 
+def _build_highlight(text: str, limit: int = 160) -> str:
+    head = text[: limit + 1]
+    # Every whitespace character except " " is unprintable, so this admits only text whose
+    # words are separated by exactly one plain space.
+    single_spaced = head.isprintable() and "  " not in head and not head.startswith(" ")
+    if not single_spaced or (len(text) <= limit and text.endswith(" ")):
+        return _build_highlight_by_words(text, limit)
+
+    # Single-spaced text (what the passage chunker emits) can be cut at the last space
+    # within ``limit`` directly, without splitting and re-joining every word.
+    if len(text) <= limit:
+        return text
+    cut = head.rfind(" ")
+    if cut == -1:
+        return text[:limit]
+    return f"{text[:cut]}..."
+
+
 def summarize_tags(
     tags: List[TaggedEntity],
     passages: List[Passage],
@@ -46,6 +64,8 @@ def summarize_tags(
 
     passage_lookup = {passage["id"]: passage for passage in passages}
     summaries: Dict[str, TagSummary] = {}
+    # Mirrors each summary's article_ids for O(1) membership checks on popular tags.
+    seen_article_ids: Dict[str, Set[str]] = {}
 
     for tag in tags:
         passage = passage_lookup.get(tag["passage_id"])
@@ -62,11 +82,14 @@ def summarize_tags(
                 "article_ids": [],
             }
             summaries[tag["canonical_id"]] = summary
+            seen_article_ids[tag["canonical_id"]] = set()
 
         highlight = _build_highlight(passage["text"])
         if highlight:
             summary["highlights"].append(highlight)
-        if tag["article_id"] not in summary["article_ids"]:
+        seen = seen_article_ids[tag["canonical_id"]]
+        if tag["article_id"] not in seen:
+            seen.add(tag["article_id"])
             summary["article_ids"].append(tag["article_id"])
 
     return {"tag_summaries": list(summaries.values())}
@@ -1,19 +1,45 @@
 from __future__ import annotations
 
 import sys
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from newsroom import ResolvedEntity, TaggedEntity
-from newsroom.llm import tag_entities_with_llm
+from newsroom.llm import tag_entities_with_llm, unique_by_span
 
+# Interned so every tagged entity shares one string object per category.
 _CATEGORY_BY_TYPE = {
-    "PERSON": "beat:people",
-    "ORG": "beat:institutions",
-    "LOCATION": "beat:places",
-    "OTHER": "beat:general",
+    entity_type: sys.intern(category)
+    for entity_type, category in {
+        "PERSON": "beat:people",
+        "ORG": "beat:institutions",
+        "LOCATION": "beat:places",
+        "OTHER": "beat:general",
+    }.items()
 }
 
 
+def _expand_tags(
+    resolved_entities: List[ResolvedEntity],
+    tags: List[Dict[str, Any]],
+) -> List[TaggedEntity]:
+    by_span = {record.get("entity"): record for record in tags}
+    expanded: List[TaggedEntity] = []
+    for entity in resolved_entities:
+        record = by_span.get(entity["span"])
+        if record is None:
+            continue
+        expanded.append(
+            {
+                **record,  # type: ignore[typeddict-item]
+                "entity": entity["span"],
+                "canonical_id": entity["canonical_id"],
+                "passage_id": entity["passage_id"],
+                "article_id": entity["article_id"],
+            }
+        )
+    return expanded
+
+
 def tag_entities(
     resolved_entities: List[ResolvedEntity],
     llm_mode: bool = False,
@@ -24,17 +50,18 @@ def tag_entities(
 
     if llm_mode and resolved_entities:
         try:
-            llm_tags = tag_entities_with_llm(resolved_entities, model=model)
+            # Each span is tagged once; the category is copied back onto every mention.
+            llm_tags = tag_entities_with_llm(unique_by_span(resolved_entities), model=model)
         except RuntimeError as exc:
             if not fallback_on_error:
                 raise
             print(f"[newsroom] llm tagging fallback: {exc}", file=sys.stderr)
         else:
-            return {"tagged_entities": llm_tags}  # type: ignore[return-value]
+            return {"tagged_entities": _expand_tags(resolved_entities, llm_tags)}
 
     tagged: List[TaggedEntity] = []
     for entity in resolved_entities:
-        category = _CATEGORY_BY_TYPE.get(entity["type"], "beat:general")
+        category = _CATEGORY_BY_TYPE.get(entity["type"], _CATEGORY_BY_TYPE["OTHER"])
         tagged.append(
             {
                 "entity": entity["span"],
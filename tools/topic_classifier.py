@@ -1,16 +1,30 @@
 from __future__ import annotations
 
 import sys
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from newsroom import Passage, TopicPrediction
+from newsroom.cues import scan_cues
 from newsroom.llm import classify_topics_with_llm
+from newsroom.parallel import map_batches
 
-_TOPIC_KEYWORDS = {
-    "Technology": ["ai", "automation", "toolkit", "openai"],
-    "Climate": ["climate", "air quality", "sensors"],
-    "Civic": ["community", "policymakers", "residents"],
-}
+
+def _classify_passages(passages: Sequence[Passage]) -> List[TopicPrediction]:
+    topics: List[TopicPrediction] = []
+
+    for passage in passages:
+        _, _, matched = scan_cues(passage["text"])
+        topic = matched or "General"
+        confidence = 0.9 if matched else 0.5
+        topics.append(
+            {
+                "passage_id": passage["id"],
+                "topic": topic,
+                "confidence": confidence,
+            }
+        )
+
+    return topics
 
 
 def classify_topic(
@@ -31,23 +45,4 @@ def classify_topic(
         else:
             return {"topics": llm_topics}  # type: ignore[return-value]
 
-    topics: List[TopicPrediction] = []
-
-    for passage in passages:
-        text_lower = passage["text"].lower()
-        topic = "General"
-        confidence = 0.5
-        for candidate, keywords in _TOPIC_KEYWORDS.items():
-            if any(keyword in text_lower for keyword in keywords):
-                topic = candidate
-                confidence = 0.9
-                break
-        topics.append(
-            {
-                "passage_id": passage["id"],
-                "topic": topic,
-                "confidence": confidence,
-            }
-        )
-
-    return {"topics": topics}
+    return {"topics": map_batches(_classify_passages, passages)}